@@ -2,7 +2,7 @@ from pathlib import Path
 
 import pytest
 import yaml
-from pydantic import field_validator
+from pydantic import ConfigDict, Field, field_validator
 
 from weldyn import BaseModel, YamlConfigurableModel
 
@@ -208,3 +208,112 @@ def test_nested_yaml_update(yaml_files, nested_yaml_content):
     assert 'attribute_1g' not in data['schema_1']['sub_schema_1a']['sub_sub_schema_1a'].keys()  # Attribute removed
     assert 'attribute_1h' in data['schema_1']['sub_schema_1a']['sub_sub_schema_1a'].keys()  # New attribute
     assert 'attribute_1e' not in data['schema_1'].keys()  # Attribute removed from main model
+
+
+def test_default_factory(tmp_path):
+    class FactoryConfig(YamlConfigurableModel):
+        schema_1: Model1 = Field(default_factory=Model1)
+
+        class YamlConfig:
+            YAML_PATH = tmp_path
+            MODEL_MAPPING = {
+                'factory': ['schema_1'],
+            }
+
+    assert FactoryConfig().schema_1.attribute_1a == 1
+
+    with open(tmp_path / 'factory.yaml') as f:
+        data = yaml.safe_load(f)
+
+    assert data['schema_1']['attribute_1a'] == 1
+
+
+def test_subclass_default(tmp_path):
+    class ParentConfig(YamlConfigurableModel):
+        schema_1: Model1 = Model1()
+
+        class YamlConfig:
+            YAML_PATH = tmp_path
+            MODEL_MAPPING = {
+                'parent': ['schema_1'],
+            }
+
+    class ChildConfig(ParentConfig):  # Overrides the parent's default, which must not be reused
+        schema_1: Model1 = Model1(attribute_1a=3)
+
+        class YamlConfig:
+            YAML_PATH = tmp_path
+            MODEL_MAPPING = {
+                'child': ['schema_1'],
+            }
+
+    assert ParentConfig().schema_1.attribute_1a == 1
+    assert ChildConfig().schema_1.attribute_1a == 3
+    assert ParentConfig().schema_1.attribute_1a == 1
+
+
+def test_aliased_field(tmp_path):
+    (tmp_path / 'aliased.yaml').write_text('schema_1:\n  attribute_1a: 5\n  attribute_1b: value\n  attribute_1c: 1\n')
+
+    class AliasedConfig(YamlConfigurableModel):
+        schema_1: Model1 = Field(Model1(), alias='Schema1')
+
+        class YamlConfig:
+            YAML_PATH = tmp_path
+            MODEL_MAPPING = {
+                'aliased': ['schema_1'],
+            }
+
+    assert AliasedConfig().schema_1.attribute_1a == 5  # Loaded from the YAML file, which uses the field name
+    # Values in the YAML file have priority, whichever key the value is passed under
+    assert AliasedConfig(Schema1={'attribute_1a': 9}).schema_1.attribute_1a == 5
+
+    class PopulatedConfig(AliasedConfig):
+        model_config = ConfigDict(populate_by_name=True)
+
+    assert PopulatedConfig().schema_1.attribute_1a == 5
+    assert PopulatedConfig(Schema1={'attribute_1a': 9}).schema_1.attribute_1a == 5
+    assert PopulatedConfig(schema_1={'attribute_1a': 9}).schema_1.attribute_1a == 5
+
+
+def test_reassigned_yaml_config(tmp_path):
+    class ReassignedConfig(YamlConfigurableModel):
+        schema_1: Model1 = Model1()
+
+        class YamlConfig:
+            YAML_PATH = tmp_path / 'before'
+            MODEL_MAPPING = {
+                'schema_1': ['schema_1'],
+            }
+
+    ReassignedConfig()
+    assert (tmp_path / 'before' / 'schema_1.yaml').is_file()
+
+    # Reassigning the YAML config after the class is defined redirects the YAML files
+    ReassignedConfig.YamlConfig.YAML_PATH = tmp_path / 'after'
+    ReassignedConfig.YamlConfig.MODEL_MAPPING = {'renamed': ['schema_1']}
+    ReassignedConfig()
+    assert (tmp_path / 'after' / 'renamed.yaml').is_file()
+
+
+def test_unmapped_default_not_validated(tmp_path):
+    class UnmappedConfig(YamlConfigurableModel):
+        schema_1: Model1 = Model1()
+        unmapped: int = 1
+        validated: int = Field(1, validate_default=True)
+
+        @field_validator('unmapped', 'validated')
+        @classmethod
+        def increment(cls, v):
+            return v + 1
+
+        class YamlConfig:
+            YAML_PATH = tmp_path
+            MODEL_MAPPING = {
+                'unmapped': ['schema_1'],
+            }
+
+    config = UnmappedConfig()
+    assert config.unmapped == 1  # Defaults of fields not dumped to YAML are not validated
+    assert config.validated == 2  # Unless requested on the field
+    assert UnmappedConfig(unmapped=1).unmapped == 2  # Passed values are validated
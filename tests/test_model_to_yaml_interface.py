@@ -1,10 +1,15 @@
+import stat
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 import yaml
 
-from weldyn import BaseModel, YamlConfigurableModel
-from weldyn.model_to_yaml_interface import load_yaml, check_yaml_path, get_model_mapping_and_path
+from weldyn import BaseModel, YamlConfigurableModel, model_to_yaml_interface
+from weldyn.model_to_yaml_interface import load_yaml, dump_yaml_data, check_yaml_path, \
+    get_model_mapping_and_path, update_yaml_from_models, update_nested_yaml_from_model, get_key_paths
 
 
 def test_generate_yaml_from_model(tmp_path):
@@ -48,18 +53,16 @@ def test_check_model_overlap():
         attr: str = 'value'
         test: int = 2
 
-    class MockModel(YamlConfigurableModel):
-        sub_model: MockSubModel = MockSubModel()
-
-        class YamlConfig:
-            YAML_PATH = '/tmp'
-            MODEL_MAPPING = {
-                'model_1': ['sub_model'],
-                'model_2': ['sub_model'],
-            }
+    with pytest.raises(ValueError):  # Raised when the class is defined
+        class MockModel(YamlConfigurableModel):
+            sub_model: MockSubModel = MockSubModel()
 
-    with pytest.raises(ValueError):
-        MockModel()
+            class YamlConfig:
+                YAML_PATH = '/tmp'
+                MODEL_MAPPING = {
+                    'model_1': ['sub_model'],
+                    'model_2': ['sub_model'],
+                }
 
 
 def test_get_model_mapping_and_path():
@@ -74,3 +77,117 @@ def test_get_model_mapping_and_path():
 
     assert yaml_path == Path('/tmp')
     assert model_mapping == {'models.yaml': ['schema_1', 'schema_2']}
+
+
+def test_get_model_mapping_and_path_str():
+    class ExampleConfigurableModel(YamlConfigurableModel):
+        class YamlConfig:
+            YAML_PATH = '/tmp'
+
+    yaml_path, model_mapping = get_model_mapping_and_path(ExampleConfigurableModel)
+
+    assert yaml_path == Path('/tmp')
+    assert model_mapping == {}
+
+
+def test_update_yaml_from_models(tmp_path):
+    class MockSubModel(BaseModel):
+        attr: str = 'value'
+        test: int = 2
+
+    with open(tmp_path / "test.yaml", "w") as f:
+        yaml.dump({'sub_model_1': {'attr': 'other value', 'test': 3}, 'removed': {'attr': 'value'}}, f)
+
+    data = update_yaml_from_models(
+        {'sub_model_1': MockSubModel().model_dump(), 'sub_model_2': MockSubModel().model_dump()},
+        ['sub_model_1', 'sub_model_2'],
+        tmp_path / "test.yaml",
+    )
+
+    expected = {'sub_model_1': {'attr': 'other value', 'test': 3}, 'sub_model_2': {'attr': 'value', 'test': 2}}
+    assert data == expected
+    assert load_yaml(tmp_path / "test.yaml") == expected
+
+
+def test_update_yaml_from_models_unchanged(tmp_path, monkeypatch):
+    class MockSubModel(BaseModel):
+        attr: str = 'value'
+        test: int = 2
+
+    with open(tmp_path / "test.yaml", "w") as f:
+        yaml.dump({'sub_model': {'attr': 'other value', 'test': 3}}, f)
+
+    def fail_dump(*args):
+        raise AssertionError("The YAML file shouldn't be written")
+
+    def fail_merge(*args):
+        raise AssertionError("The YAML data shouldn't be merged")
+
+    monkeypatch.setattr(model_to_yaml_interface, 'dump_yaml_data', fail_dump)
+    monkeypatch.setattr(model_to_yaml_interface, 'update_nested_yaml_from_model', fail_merge)
+    data = update_yaml_from_models({'sub_model': MockSubModel().model_dump()}, ['sub_model'], tmp_path / "test.yaml")
+
+    assert data == {'sub_model': {'attr': 'other value', 'test': 3}}
+
+
+def test_update_nested_yaml_from_model():
+    model_data = {'a': 1, 'b': {'c': 2, 'd': {'e': 3, 'f': 4}}, 'g': {'h': 5}}
+    yaml_data = {'b': {'d': {'f': 40, 'removed': 0}, 'c': 20}, 'g': 50, 'a': 10, 'removed': 0}
+
+    updated_data = update_nested_yaml_from_model(model_data, yaml_data)
+
+    assert updated_data == {'a': 10, 'b': {'c': 20, 'd': {'e': 3, 'f': 40}}, 'g': {'h': 5}}
+    assert list(updated_data['b']) == ['c', 'd']  # Model's order is kept
+
+
+def test_dump_yaml_data(tmp_path):
+    dump_yaml_data(tmp_path / "test.yaml", {'attr': {'attr': 42}})
+    dump_yaml_data(tmp_path / "test.yaml", {'attr': {'attr': 43}})  # Replaces the existing file
+
+    assert load_yaml(tmp_path / "test.yaml") == {'attr': {'attr': 43}}
+    assert [path.name for path in tmp_path.iterdir()] == ["test.yaml"]  # No temporary file left behind
+
+
+def test_dump_yaml_data_symlink(tmp_path):
+    (tmp_path / "dotfiles").mkdir()
+    dump_yaml_data(tmp_path / "dotfiles" / "test.yaml", {'attr': {'attr': 42}})
+    (tmp_path / "test.yaml").symlink_to(tmp_path / "dotfiles" / "test.yaml")
+
+    dump_yaml_data(tmp_path / "test.yaml", {'attr': {'attr': 43}})
+
+    assert (tmp_path / "test.yaml").is_symlink()  # The link is kept
+    assert load_yaml(tmp_path / "dotfiles" / "test.yaml") == {'attr': {'attr': 43}}  # The linked file is updated
+    assert [path.name for path in (tmp_path / "dotfiles").iterdir()] == ["test.yaml"]
+
+
+def test_dump_yaml_data_mode(tmp_path):
+    dump_yaml_data(tmp_path / "test.yaml", {'attr': {'attr': 42}})
+    (tmp_path / "reference.yaml").write_text('')
+    # A new file gets the same mode as with `open`
+    assert (tmp_path / "test.yaml").stat().st_mode == (tmp_path / "reference.yaml").stat().st_mode
+
+    (tmp_path / "test.yaml").chmod(0o600)
+    dump_yaml_data(tmp_path / "test.yaml", {'attr': {'attr': 43}})
+
+    assert stat.S_IMODE((tmp_path / "test.yaml").stat().st_mode) == 0o600  # The mode of the file is kept
+
+
+def test_dump_yaml_data_threads(tmp_path):
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(dump_yaml_data, tmp_path / "test.yaml", {'attr': i}) for i in range(64)]
+    for future in futures:
+        future.result()  # Each writer has its own temporary file, so none of them fails
+
+    assert load_yaml(tmp_path / "test.yaml")['attr'] in range(64)
+    assert [path.name for path in tmp_path.iterdir()] == ["test.yaml"]
+
+
+def test_get_key_paths():
+    assert get_key_paths({'a': 1, 'b': {'c': 2}}) == {(('a',), False), (('b',), True), (('b', 'c'), False)}
+    assert get_key_paths({'a': 1}) != get_key_paths({'a': {}})  # Same keys but different structure
+
+
+def test_yaml_imported_lazily():
+    # Run in a fresh interpreter, as the tests themselves import `yaml`
+    code = "import sys, weldyn; assert 'yaml' not in sys.modules, 'PyYAML imported by weldyn'"
+    subprocess.run([sys.executable, '-c', code], check=True, cwd=Path(__file__).parents[1])
@@ -1,22 +1,48 @@
+import os
+import secrets
+import shutil
+from collections import deque
+from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Collection
 
-import yaml
-from pydantic import BaseModel, Field
 
-
-class OrderedDumper(yaml.Dumper):
+@lru_cache(maxsize=None)
+def get_yaml_loader_and_dumper() -> tuple[Any, type, type]:
     """
-    A YAML Dumper that preserves the order of the Pydantic model's fields.
+    Import PyYAML and set up the YAML loader and dumper on first use.
+
+    PyYAML (and libyaml, if available) is only imported once a YAML file is actually read or written, so importing
+    `weldyn` stays cheap for applications that don't touch their configuration.
+
+    :return: A tuple containing the `yaml` module, the loader and the order-preserving dumper.
     """
-    pass
+    import yaml
+
+    try:  # Use the libyaml bindings when available, they are much faster than the pure-Python implementation
+        from yaml import CSafeLoader as SafeLoader, CDumper as Dumper
+    except ImportError:
+        from yaml import SafeLoader, Dumper
+
+    class OrderedDumper(Dumper):
+        """
+        A YAML Dumper that preserves the order of the Pydantic model's fields.
+        """
+        pass
 
+    yaml.add_representer(
+        dict,  # Use dict to preserve order when dumping the YAML
+        lambda self, data: self.represent_mapping('tag:yaml.org,2002:map', data.items()),
+        Dumper=OrderedDumper
+    )
+    return yaml, SafeLoader, OrderedDumper
 
-yaml.add_representer(
-    dict,  # Use dict to preserve order when dumping the YAML
-    lambda self, data: self.represent_mapping('tag:yaml.org,2002:map', data.items()),
-    Dumper=OrderedDumper
-)
+
+def __getattr__(name: str) -> Any:
+    if name == 'OrderedDumper':  # Kept importable from this module, although it is now created lazily
+        return get_yaml_loader_and_dumper()[2]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def load_yaml(file_path: Path) -> dict[str, Any]:
@@ -26,8 +52,8 @@ def load_yaml(file_path: Path) -> dict[str, Any]:
     :param file_path: Path of the associated YAML file (must contain the file name and extension)
     :return: Dictionary of the loaded YAML file
     """
-    with open(file_path, 'r') as file:
-        data = yaml.safe_load(file)
+    yaml, loader, _ = get_yaml_loader_and_dumper()
+    data = yaml.load(file_path.read_bytes(), Loader=loader)  # Read in one go instead of through a file object
     return data
 
 
@@ -38,56 +64,78 @@ def dump_yaml_data(yaml_file_path: Path, data: dict[str, Any]) -> None:
     :param yaml_file_path: Path to the YAML file to dump into.
     :param data: Dictionary to dump into the YAML file.
     """
-    with open(yaml_file_path, 'w') as file:
-        yaml.dump(data, file, Dumper=OrderedDumper)
-
-
-def generate_yaml_from_model(info: Field, model_class: type[BaseModel], yaml_file_path: Path) -> None:
+    yaml, _, dumper = get_yaml_loader_and_dumper()
+    # Serialize in memory and write in one go, rather than streaming many small writes to the file
+    content = yaml.dump(data, Dumper=dumper, encoding='utf-8')
+    # Write to a temporary file next to the target and rename it, so the YAML file is never left partially written.
+    # Symlinks are resolved so the file they point to is updated, rather than the link being replaced.
+    target_path = yaml_file_path.resolve()
+    # The name is unique to each writer, and the file is created with the mode `open` would give it (the umask applies)
+    tmp_file_path = target_path.with_name(f'{target_path.name}.{secrets.token_hex(8)}.tmp')
+    fd = os.open(tmp_file_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, 'wb', buffering=65536) as file:
+            file.write(content)
+        if target_path.exists():  # Keep the mode of the existing file, e.g. a file only readable by its owner
+            shutil.copymode(target_path, tmp_file_path)
+        os.replace(tmp_file_path, target_path)
+    except BaseException:
+        tmp_file_path.unlink(missing_ok=True)
+        raise
+
+
+def generate_yaml_from_models(default_data: dict[str, dict[str, Any]], yaml_file_path: Path) -> dict[str, Any]:
     """
-    Generates a YAML file representing a given Pydantic model.
+    Generates a YAML file representing the given Pydantic models.
 
-    This function serializes a new instance of the provided Pydantic model class, using the model's default values.
-    The serialized model is then written to a new YAML file at the specified path.
+    This function writes the serialized default of each sub-model dumped in the file all at once to a new YAML file at
+    the specified path.
 
-    :param info: The Pydantic field being processed.
-    :param model_class: The class of the Pydantic field being processed.
+    :param default_data: Serialized defaults of the sub-models to dump in the file, keyed by field name. They are not
+    modified.
     :param yaml_file_path: The desired Path for the new YAML file. This path must include the desired file name and
     extension.
+    :return: Data written to the YAML file.
     """
-    model_data = model_class.model_dump()
-    data = {info.field_name: model_data}
+    data = deepcopy(default_data)  # Don't share the defaults with the returned data
+    yaml_file_path.parent.mkdir(exist_ok=True, parents=True)
     dump_yaml_data(yaml_file_path, data)
+    return data
 
 
 def update_nested_yaml_from_model(model_data: dict[str, Any], yaml_data: dict[str, Any]) -> dict[str, Any]:
     """
-    Recursively update the YAML data based on the given model data.
+    Update the YAML data based on the given model data, going through the nested levels with an explicit stack.
 
     :param model_data: Data generated from the Pydantic model, to update the YAML data.
     :param yaml_data: Original YAML data to be updated.
     :return: Updated YAML data after merging with the model data.
     """
-    updated_data = {}
-
-    for key, value in model_data.items():
-        # If this key is in the YAML data and is a dictionary, go one level deeper
-        if key in yaml_data and isinstance(value, dict) and isinstance(yaml_data[key], dict):
-            updated_data[key] = update_nested_yaml_from_model(value, yaml_data[key])
-        # If the key is in the YAML data but the structure changed, take model's structure but YAML's value
-        elif key in yaml_data and not isinstance(value, dict):
-            updated_data[key] = yaml_data[key]
-        # If the key is not in the YAML data, take the model's data
-        else:
-            updated_data[key] = value
+    updated_data = dict.fromkeys(model_data)  # Keys are created in the model's order, values are filled in below
+    stack = deque([(model_data, yaml_data, updated_data)])
+
+    while stack:
+        model_level, yaml_level, updated_level = stack.pop()
+        for key, value in model_level.items():
+            # If this key is in the YAML data and is a dictionary, go one level deeper
+            if key in yaml_level and isinstance(value, dict) and isinstance(yaml_level[key], dict):
+                updated_level[key] = dict.fromkeys(value)
+                stack.append((value, yaml_level[key], updated_level[key]))
+            # If the key is in the YAML data but the structure changed, take model's structure but YAML's value
+            elif key in yaml_level and not isinstance(value, dict):
+                updated_level[key] = yaml_level[key]
+            # If the key is not in the YAML data, take a copy of the model's data
+            else:
+                updated_level[key] = deepcopy(value)
     return updated_data
 
 
-def remove_missing_sections(data: dict[str, Any], models: list[str]) -> dict[str, Any]:
+def remove_missing_sections(data: dict[str, Any], models: Collection[str]) -> dict[str, Any]:
     """
     Remove missing sections from the given data dictionary.
 
     :param data: Original data dictionary.
-    :param models: List of models that are expected to be present in the data.
+    :param models: Models that are expected to be present in the data.
     :return: Updated dictionary after removing missing sections.
     """
     missing_sections = [section for section in data if section not in models]
@@ -96,49 +144,96 @@ def remove_missing_sections(data: dict[str, Any], models: list[str]) -> dict[str
     return data
 
 
-def update_yaml_from_model(info: Field, model_class: type[BaseModel], models: list[str], yaml_file_path: Path):
+def get_key_paths(data: dict[str, Any]) -> frozenset[tuple[tuple[Any, ...], bool]]:
+    """
+    Flatten the structure of nested data into the set of its key paths.
+
+    Each key path is paired with whether its value is a dictionary, so two nested dictionaries have the same key paths
+    only if they have the same structure.
+
+    :param data: Nested data to flatten.
+    :return: Set of the key paths of the data.
+    """
+    key_paths = []
+    stack = [((), data)]
+
+    while stack:
+        prefix, level = stack.pop()
+        for key, value in level.items():
+            key_path = prefix + (key,)
+            is_dict = isinstance(value, dict)
+            key_paths.append((key_path, is_dict))
+            if is_dict:
+                stack.append((key_path, value))
+    return frozenset(key_paths)
+
+
+def update_yaml_from_models(default_data: dict[str, dict[str, Any]], models: Collection[str], yaml_file_path: Path,
+                            default_key_paths: dict[str, frozenset] | None = None) -> dict[str, Any]:
     """
-    Update a YAML file based on a given Pydantic model and field.
+    Update a YAML file based on the given Pydantic models.
 
-    :param info: Pydantic field to be processed.
-    :param model_class: Class of the Pydantic field to be processed.
-    :param models: List of models that are expected to be present in the YAML file.
+    The file is loaded once, every sub-model dumped in it is merged in memory, and the result is written back once. The
+    file is left untouched if the merge doesn't change its content, and the merge itself is skipped if the file already
+    has the structure of the sub-models.
+
+    :param default_data: Serialized defaults of the sub-models dumped in the file, keyed by field name. They are not
+    modified.
+    :param models: Models that are expected to be present in the YAML file.
     :param yaml_file_path: Path to the existing YAML file.
-    :return: Data of the Pydantic field as present in the YAML file, either pre-existing or newly generated.
+    :param default_key_paths: Key paths of each serialized default, as returned by `get_key_paths`. Computed from
+    `default_data` if not given.
+    :return: Data of the YAML file, with each sub-model either pre-existing or newly generated.
     """
-    data = load_yaml(yaml_file_path)
+    yaml_data = load_yaml(yaml_file_path) or {}
+
+    if default_key_paths is None:
+        default_key_paths = {field_name: get_key_paths(model_data) for field_name, model_data in default_data.items()}
+    # If no section has to be removed and every sub-model has the same structure as in the file, the merge would give
+    # back the YAML data unchanged
+    if all(section in models for section in yaml_data) and all(
+        isinstance(yaml_data.get(field_name), dict) and get_key_paths(yaml_data[field_name]) == key_paths
+        for field_name, key_paths in default_key_paths.items()
+    ):
+        return yaml_data
 
-    model_data = model_class.model_dump()
+    data = dict(yaml_data)  # Nested sections are never modified in place, so a shallow copy is enough to compare
 
-    if info.field_name not in data or any(key not in data[info.field_name] for key in model_data):
-        data[info.field_name] = model_data
+    for field_name, model_data in default_data.items():
+        if field_name not in data or any(key not in data[field_name] for key in model_data):
+            data[field_name] = deepcopy(model_data)
 
-    if info.field_name in data and isinstance(data[info.field_name], dict):
-        data[info.field_name] = update_nested_yaml_from_model(model_data, data[info.field_name])
+        if field_name in data and isinstance(data[field_name], dict):
+            data[field_name] = update_nested_yaml_from_model(model_data, data[field_name])
 
     data = remove_missing_sections(data, models)
-    dump_yaml_data(yaml_file_path, data)
+    if data != yaml_data:
+        dump_yaml_data(yaml_file_path, data)
 
-    return data[info.field_name]
+    return data
 
 
 def check_yaml_path(yaml_file: str, yaml_path: Path) -> Path:
     """
     Check if the YAML file exists and create it if it doesn't.
     """
-    if not yaml_file.endswith('.yaml') and not yaml_file.endswith('.yml'):
+    if not yaml_file.endswith(('.yaml', '.yml')):
         yaml_file += '.yaml'
     yaml_file_path = yaml_path / yaml_file
     yaml_file_path.parent.mkdir(exist_ok=True, parents=True)
     return yaml_file_path
 
 
-def check_model_overlap(info: Field, model_mapping: dict[str, list[str]]) -> None:
+def check_model_overlap(model_mapping: dict[str, list[str]]) -> None:
     """
     Check if a sub-model is dumped in several files.
     """
-    if len([yaml_file for yaml_file, models in model_mapping.items() if info.field_name in models]) > 1:
-        raise ValueError(f"The sub-model {info.field_name} cannot be dumped in more than one YAML file.")
+    mapped_models = set()
+    for models in model_mapping.values():
+        for model in set(models):
+            if model in mapped_models:
+                raise ValueError(f"The sub-model {model} cannot be dumped in more than one YAML file.")
+            mapped_models.add(model)
 
 
 def get_model_mapping_and_path(cls) -> tuple[Path, dict[str | None, list[str]]]:
@@ -152,6 +247,8 @@ def get_model_mapping_and_path(cls) -> tuple[Path, dict[str | None, list[str]]]:
     :return: A tuple containing the YAML path and model mapping.
     """
     yaml_path = cls.YamlConfig.YAML_PATH
+    if yaml_path is not None and not isinstance(yaml_path, Path):
+        yaml_path = Path(yaml_path)
     if hasattr(cls.YamlConfig, "MODEL_MAPPING"):
         model_mapping = cls.YamlConfig.MODEL_MAPPING
     else:
@@ -1,10 +1,42 @@
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, ClassVar
 
-from pydantic import BaseModel, model_validator, field_validator, ConfigDict
-from pydantic_core.core_schema import ValidationInfo
+from pydantic import AliasChoices, BaseModel, model_validator, field_validator
 
 from .model_to_yaml_interface import get_model_mapping_and_path, check_model_overlap, check_yaml_path, \
-    update_yaml_from_model, generate_yaml_from_model
+    update_yaml_from_models, generate_yaml_from_models, get_key_paths
+
+
+@dataclass(slots=True, frozen=True)
+class _FrozenYamlCfg:
+    """
+    YAML configuration of a `YamlConfigurableModel` subclass, resolved once when the class is defined.
+
+    All members are immutable. Values computed on first use are kept separately, in `_YamlCfgCache`.
+
+    :param source: `YAML_PATH` and `MODEL_MAPPING` objects the configuration was resolved from.
+    :param yaml_path: Directory of the YAML files.
+    :param file_to_fields: For each YAML file name, the models expected in it and the fields dumped to it, each with
+    the input key under which Pydantic reads its value and the other keys it could be passed under.
+    """
+    source: tuple[Any, Any]
+    yaml_path: Path | None
+    file_to_fields: tuple[tuple[str, frozenset[str], tuple[tuple[str, str, tuple[str, ...]], ...]], ...]
+
+
+@dataclass(slots=True)
+class _YamlCfgCache:
+    """
+    Values of a `YamlConfigurableModel` subclass that are computed on first use and reused by later instantiations.
+
+    :param resolved_paths: Maps each YAML file name to its resolved path.
+    :param default_data: Dumped default of each sub-model.
+    :param default_key_paths: Key paths of each dumped default, filled in along with `default_data`.
+    """
+    resolved_paths: dict[str, Path] = field(default_factory=dict)
+    default_data: dict[str, dict[str, Any]] = field(default_factory=dict)
+    default_key_paths: dict[str, frozenset] = field(default_factory=dict)
 
 
 class YamlConfigurableModel(BaseModel):
@@ -45,33 +77,126 @@ class YamlConfigurableModel(BaseModel):
     cfg = MyConfig()
     ```
     """
-    model_config = ConfigDict(
-        validate_default=True,
-    )
-
     class YamlConfig:
         YAML_PATH: Path | str
         MODEL_MAPPING: dict[str, list[str]]
 
-    @model_validator(mode="before")
-    def check_yaml_path(cls, values):
-        yaml_path = cls.YamlConfig.YAML_PATH
-        if not isinstance(yaml_path, Path):
-            cls.YamlConfig.YAML_PATH = Path(yaml_path)
-        return values
+    _yaml_cfg: ClassVar[_FrozenYamlCfg | None] = None  # `None` until a `YAML_PATH` is defined
+    _yaml_cache: ClassVar[_YamlCfgCache]
 
-    @field_validator("*", mode='before')
-    def load_or_generate_model_config(cls, v, info: ValidationInfo):
-        yaml_path, model_mapping = get_model_mapping_and_path(cls)
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._build_yaml_cfg()
 
+    @classmethod
+    def _get_yaml_cfg_source(cls) -> tuple[Any, Any]:
+        return getattr(cls.YamlConfig, 'YAML_PATH', None), getattr(cls.YamlConfig, 'MODEL_MAPPING', None)
+
+    @classmethod
+    def _build_yaml_cfg(cls) -> None:
+        if not hasattr(cls.YamlConfig, 'YAML_PATH'):
+            cls._yaml_cfg = None
+            return
+
+        yaml_path, model_mapping = get_model_mapping_and_path(cls)
         if yaml_path is not None:
-            check_model_overlap(info, model_mapping)
-
-            for yaml_file, models in model_mapping.items():
-                if info.field_name in models:
-                    model_class = cls.model_fields[info.field_name].get_default()
-                    yaml_file_path = check_yaml_path(yaml_file, yaml_path)
-                    if not yaml_file_path.is_file():
-                        generate_yaml_from_model(info, model_class, yaml_file_path)
-                    return update_yaml_from_model(info, model_class, models, yaml_file_path)
-        return v
+            # Overlaps between the declared sub-models are rejected when the class is defined, not on each instantiation
+            check_model_overlap({
+                yaml_file: [model for model in models if model in cls.model_fields]
+                for yaml_file, models in model_mapping.items()
+            })
+        # Reverse index of the model mapping, so each field finds its YAML file with a single lookup. Models are kept
+        # as frozensets for constant-time membership checks, `MODEL_MAPPING` itself is left as defined.
+        field_to_file = {}
+        for yaml_file, models in model_mapping.items():
+            models = frozenset(models)
+            for field_name in models:
+                field_to_file[field_name] = (yaml_file, models)
+        # Group the declared sub-models by YAML file, in the order of the model's fields
+        file_to_fields = {}
+        for field_name in cls.model_fields:
+            if field_name in field_to_file:
+                yaml_file, models = field_to_file[field_name]
+                file_to_fields.setdefault(yaml_file, (models, []))[1].append(field_name)
+        cls._yaml_cfg = _FrozenYamlCfg(
+            source=cls._get_yaml_cfg_source(),
+            yaml_path=yaml_path,
+            file_to_fields=tuple(
+                (yaml_file, models, tuple(cls._get_input_keys(field_name) for field_name in field_names))
+                for yaml_file, (models, field_names) in file_to_fields.items()
+            ),
+        )
+        cls._yaml_cache = _YamlCfgCache()
+
+    @classmethod
+    def _get_input_keys(cls, field_name: str) -> tuple[str, str, tuple[str, ...]]:
+        # Pydantic only reads a field under its alias, unless population by name is enabled
+        model_field = cls.model_fields[field_name]
+        validation_alias = model_field.validation_alias
+        if isinstance(validation_alias, AliasChoices):
+            aliases = [choice for choice in validation_alias.choices if isinstance(choice, str)]
+        elif isinstance(validation_alias, str):
+            aliases = [validation_alias]
+        elif validation_alias is None and model_field.alias is not None:
+            aliases = [model_field.alias]
+        else:
+            aliases = []
+        if (
+            not aliases or cls.model_config.get('validate_by_name') or cls.model_config.get('populate_by_name')
+            or cls.model_config.get('validate_by_alias') is False
+        ):
+            input_key = field_name
+        else:
+            input_key = aliases[0]
+        # Any copy passed under another key would be read instead of, or along with, the YAML value
+        other_keys = tuple(dict.fromkeys(key for key in [field_name, *aliases] if key != input_key))
+        return field_name, input_key, other_keys
+
+    @classmethod
+    def _get_default_data(cls, field_name: str) -> tuple[dict[str, Any], frozenset]:
+        model_field = cls.model_fields[field_name]
+        if model_field.default_factory is not None:  # A factory may return a different model on each call
+            default_data = model_field.get_default(call_default_factory=True).model_dump()
+            return default_data, get_key_paths(default_data)
+        # A static default is only dumped, never mutated, so its dump is computed once per class. The default is used
+        # as-is rather than the deep copy from `get_default`.
+        yaml_cache = cls._yaml_cache
+        default_data = yaml_cache.default_data.get(field_name)
+        if default_data is None:
+            default_data = yaml_cache.default_data[field_name] = model_field.default.model_dump()
+            yaml_cache.default_key_paths[field_name] = get_key_paths(default_data)
+        return default_data, yaml_cache.default_key_paths[field_name]
+
+    @model_validator(mode="before")
+    def _hydrate_from_yaml(cls, values):
+        # Single pass over the whole input: Pydantic then validates each field once, from the data of its YAML file
+        yaml_cfg = cls._yaml_cfg
+        yaml_path, model_mapping = cls._get_yaml_cfg_source()
+        if yaml_cfg is None or yaml_path is not yaml_cfg.source[0] or model_mapping is not yaml_cfg.source[1]:
+            # `YAML_PATH` or `MODEL_MAPPING` was reassigned since the configuration was resolved
+            cls._build_yaml_cfg()
+            yaml_cfg = cls._yaml_cfg
+        if yaml_cfg is None:
+            raise AttributeError(f"`{cls.__name__}.YamlConfig` must define `YAML_PATH`.")
+        if yaml_cfg.yaml_path is None or not isinstance(values, dict):
+            return values
+
+        values = dict(values)
+        for yaml_file, models, field_keys in yaml_cfg.file_to_fields:
+            default_data, default_key_paths = {}, {}
+            for field_name, _, _ in field_keys:
+                default_data[field_name], default_key_paths[field_name] = cls._get_default_data(field_name)
+            resolved_paths = cls._yaml_cache.resolved_paths
+            yaml_file_path = resolved_paths.get(yaml_file)
+            if yaml_file_path is None:
+                yaml_file_path = resolved_paths[yaml_file] = check_yaml_path(yaml_file, yaml_cfg.yaml_path)
+            if yaml_file_path.is_file():
+                data = update_yaml_from_models(default_data, models, yaml_file_path, default_key_paths)
+            else:
+                data = generate_yaml_from_models(default_data, yaml_file_path)
+            for field_name, input_key, other_keys in field_keys:  # Values in the YAML file have priority
+                for key in other_keys:
+                    values.pop(key, None)
+                values[input_key] = data[field_name]
+        return values